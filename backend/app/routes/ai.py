@@ -6,16 +6,25 @@ Provides endpoints for:
 - Career analysis
 - Interview preparation
 - Learning path generation
+- Bulk career analysis / learning paths via the OpenAI Batch API
+
+Generation endpoints accept `"stream": true` to receive the response
+incrementally as Server-Sent Events instead of a single JSON body.
 """
 
+from typing import AsyncIterator, List, Optional
+
+import orjson
 from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel
-from typing import List, Optional
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 
-from app.services.llm_service import LLMService
+from app.services.batch_service import MAX_BATCH_REQUESTS, BatchService
+from app.services.llm_service import MAX_PROMPT_ITEMS, LLMService
 
 router = APIRouter()
 llm_service = LLMService()
+batch_service = BatchService(llm_service)
 
 
 # Request/Response schemas
@@ -23,27 +32,68 @@ class TestPromptRequest(BaseModel):
     """Request schema for testing LLM with a custom prompt."""
     prompt: str
     system_prompt: Optional[str] = None
+    stream: bool = False
 
 
 class CareerAnalysisRequest(BaseModel):
     """Request schema for career profile analysis."""
-    skills: List[str]
+    skills: List[str] = Field(..., max_length=MAX_PROMPT_ITEMS)
     experience_years: int
     goals: str
+    stream: bool = False
 
 
 class InterviewPrepRequest(BaseModel):
     """Request schema for interview question generation."""
     role: str
     level: str  # junior, mid, senior
+    stream: bool = False  # streams raw JSON fragments, not a parsed questions list
 
 
 class LearningPathRequest(BaseModel):
     """Request schema for learning path generation."""
-    current_skills: List[str]
+    current_skills: List[str] = Field(..., max_length=MAX_PROMPT_ITEMS)
+    target_role: str
+    stream: bool = False
+
+
+class BatchCareerAnalysis(BaseModel):
+    """One career analysis within a batch job."""
+    user_id: int
+    skills: List[str] = Field(..., max_length=MAX_PROMPT_ITEMS)
+    experience_years: int
+    goals: str
+
+
+class BatchLearningPath(BaseModel):
+    """One learning path within a batch job."""
+    user_id: int
+    current_skills: List[str] = Field(..., max_length=MAX_PROMPT_ITEMS)
     target_role: str
 
 
+class BatchAnalyzeRequest(BaseModel):
+    """Request schema for bulk analysis via the OpenAI Batch API."""
+    career_analyses: List[BatchCareerAnalysis] = Field([], max_length=MAX_BATCH_REQUESTS)
+    learning_paths: List[BatchLearningPath] = Field([], max_length=MAX_BATCH_REQUESTS)
+
+
+# Streaming helpers
+async def _sse_events(chunks: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """Wrap LLM text chunks as Server-Sent Events, ending with [DONE]."""
+    try:
+        async for token in chunks:
+            yield b"data: " + orjson.dumps({"token": token}) + b"\n\n"
+    except Exception as e:
+        yield b"data: " + orjson.dumps({"error": str(e)}) + b"\n\n"
+    yield b"data: [DONE]\n\n"
+
+
+def _stream_response(chunks: AsyncIterator[str]) -> StreamingResponse:
+    """Build a text/event-stream response from LLM text chunks."""
+    return StreamingResponse(_sse_events(chunks), media_type="text/event-stream")
+
+
 @router.post("/test")
 async def test_llm(request: TestPromptRequest):
     """
@@ -59,9 +109,16 @@ async def test_llm(request: TestPromptRequest):
         LLM response with token usage
     """
     try:
-        result = llm_service.generate_response(
+        if request.stream:
+            return _stream_response(
+                llm_service.generate_response_stream(request.prompt, request.system_prompt)
+            )
+
+        # Free-form prompts may reuse answers to similarly worded ones
+        result = await llm_service.generate_response(
             prompt=request.prompt,
-            system_prompt=request.system_prompt
+            system_prompt=request.system_prompt,
+            semantic=True
         )
 
         if not result["success"]:
@@ -75,6 +132,8 @@ async def test_llm(request: TestPromptRequest):
             "data": result
         }
 
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -104,7 +163,15 @@ async def analyze_career(request: CareerAnalysisRequest):
         AI-generated career analysis
     """
     try:
-        result = llm_service.analyze_career_profile(
+        if request.stream:
+            return _stream_response(await llm_service.analyze_career_profile(
+                skills=request.skills,
+                experience_years=request.experience_years,
+                goals=request.goals,
+                stream=True
+            ))
+
+        result = await llm_service.analyze_career_profile(
             skills=request.skills,
             experience_years=request.experience_years,
             goals=request.goals
@@ -122,6 +189,13 @@ async def analyze_career(request: CareerAnalysisRequest):
             "tokens_used": result["tokens"]["total"]
         }
 
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -136,11 +210,16 @@ async def generate_interview_questions(request: InterviewPrepRequest):
 
     Creates realistic interview questions for interview preparation.
 
+    With `stream` set, the events carry the model's raw JSON output in
+    fragments ({"questions": [...]} once concatenated); the client must
+    assemble and parse it. Only the non-streaming response is validated
+    and returns the parsed `questions` list.
+
     Args:
         request: Role and experience level
 
     Returns:
-        AI-generated interview questions
+        AI-generated interview questions as a list
     """
     try:
         # Validate level
@@ -148,7 +227,14 @@ async def generate_interview_questions(request: InterviewPrepRequest):
         if request.level.lower() not in valid_levels:
             raise ValueError(f"Level must be one of: {', '.join(valid_levels)}")
 
-        result = llm_service.generate_interview_questions(
+        if request.stream:
+            return _stream_response(await llm_service.generate_interview_questions(
+                role=request.role,
+                level=request.level,
+                stream=True
+            ))
+
+        result = await llm_service.generate_interview_questions(
             role=request.role,
             level=request.level
         )
@@ -163,10 +249,12 @@ async def generate_interview_questions(request: InterviewPrepRequest):
             "status": "success",
             "role": request.role,
             "level": request.level,
-            "questions": result["response"],
+            "questions": result["parsed"].questions,
             "tokens_used": result["tokens"]["total"]
         }
 
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -193,7 +281,14 @@ async def generate_learning_path(request: LearningPathRequest):
         AI-generated learning path with milestones
     """
     try:
-        result = llm_service.create_learning_path(
+        if request.stream:
+            return _stream_response(await llm_service.create_learning_path(
+                current_skills=request.current_skills,
+                target_role=request.target_role,
+                stream=True
+            ))
+
+        result = await llm_service.create_learning_path(
             current_skills=request.current_skills,
             target_role=request.target_role
         )
@@ -211,6 +306,13 @@ async def generate_learning_path(request: LearningPathRequest):
             "tokens_used": result["tokens"]["total"]
         }
 
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -218,6 +320,73 @@ async def generate_learning_path(request: LearningPathRequest):
         )
 
 
+@router.post("/batch-analyze", status_code=status.HTTP_202_ACCEPTED)
+async def batch_analyze(request: BatchAnalyzeRequest):
+    """
+    Submit career analyses and learning paths as one OpenAI Batch API job.
+
+    For bulk, non-interactive enrichment (e.g. a cohort of users).
+    Batch requests cost half as much as synchronous ones and complete
+    within 24 hours; poll /batch-status/{batch_id} for results.
+
+    Args:
+        request: Lists of career analyses and learning paths, each with a user_id
+
+    Returns:
+        Batch job id and status
+    """
+    try:
+        job = await batch_service.submit(
+            career_analyses=[item.model_dump() for item in request.career_analyses],
+            learning_paths=[item.model_dump() for item in request.learning_paths]
+        )
+        return {"status": "success", **job}
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Batch submission error: {str(e)}"
+        )
+
+
+@router.get("/batch-status/{batch_id}")
+async def batch_status(batch_id: str):
+    """
+    Check a batch job and return its results once it has finished.
+
+    Args:
+        batch_id: Id returned by /batch-analyze
+
+    Returns:
+        Job status, progress counts and, once finished, per-user results
+        (including failed requests)
+    """
+    try:
+        job = await batch_service.get_status(batch_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Batch status error: {str(e)}"
+        )
+
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Batch not found"
+        )
+    return job
+
+
 @router.get("/status")
 async def llm_status():
     """
@@ -231,5 +400,9 @@ async def llm_status():
         "model": llm_service.model,
         "temperature": llm_service.temperature,
         "max_tokens": llm_service.max_tokens,
+        "endpoints": [
+            {"name": e.name, "model": e.model, "in_flight": e.in_flight}
+            for e in llm_service.endpoints
+        ],
         "message": "✅ Ready to process requests" if llm_service.client else "⚠️ API key not configured"
     }
@@ -5,27 +5,30 @@ Simple endpoints to verify the API is running and healthy.
 Useful for load balancers, monitoring, and deployment checks.
 """
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 router = APIRouter()
 
+# Probe bodies never change, so serialize them once at import time
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "AI-Smart-Career-Coach API"})
+_LIVE_BODY = orjson.dumps({"status": "alive"})
+_READY_BODY = orjson.dumps({"status": "ready"})
+
 
 @router.get("/")
 async def health_check():
     """Simple health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": "AI-Smart-Career-Coach API"
-    }
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 
 @router.get("/live")
 async def liveness_probe():
     """Kubernetes liveness probe endpoint."""
-    return {"status": "alive"}
+    return Response(_LIVE_BODY, media_type="application/json")
 
 
 @router.get("/ready")
 async def readiness_probe():
     """Kubernetes readiness probe endpoint."""
-    return {"status": "ready"}
+    return Response(_READY_BODY, media_type="application/json")
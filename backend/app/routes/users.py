@@ -13,19 +13,25 @@ router = APIRouter()
 user_service = UserService()
 
 
-@router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
+# UserService returns trusted UserResponse objects, so the schema is only
+# documented via `responses` rather than re-validated with `response_model`.
+@router.post(
+    "/register",
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_201_CREATED: {"model": UserResponse}}
+)
 async def register_user(user_data: UserCreate):
     """Register a new user."""
-    existing_user = user_service.get_user_by_email(user_data.email)
-    if existing_user:
+    try:
+        return user_service.create_user(user_data)
+    except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
+            detail=str(e)
         )
-    return user_service.create_user(user_data)
 
 
-@router.get("/{user_id}", response_model=UserResponse)
+@router.get("/{user_id}", responses={status.HTTP_200_OK: {"model": UserResponse}})
 async def get_user(user_id: int):
     """Retrieve user by ID."""
     user = user_service.get_user(user_id)
@@ -37,10 +43,16 @@ async def get_user(user_id: int):
     return user
 
 
-@router.put("/{user_id}", response_model=UserResponse)
+@router.put("/{user_id}", responses={status.HTTP_200_OK: {"model": UserResponse}})
 async def update_user(user_id: int, user_data: UserUpdate):
     """Update user information."""
-    user = user_service.update_user(user_id, user_data)
+    try:
+        user = user_service.update_user(user_id, user_data)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -0,0 +1,219 @@
+"""
+Batch service for bulk, non-interactive LLM jobs.
+
+Submits many career analyses / learning paths as a single OpenAI Batch API
+job (half the price of synchronous calls, results within 24h) and collects
+the results once the job completes.
+"""
+
+import json
+import logging
+from typing import List, Optional
+
+import anyio
+
+from app.services.llm_service import (
+    CAREER_SYSTEM_PROMPT,
+    LEARNING_SYSTEM_PROMPT,
+    LLMService,
+    format_career_prompt,
+    format_learning_prompt,
+)
+
+logger = logging.getLogger(__name__)
+
+# Batch statuses after which the job will not change any more
+FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Most requests the Batch API accepts in one batch
+MAX_BATCH_REQUESTS = 50_000
+
+
+class BatchService:
+    """Service for submitting and tracking OpenAI Batch API jobs."""
+
+    def __init__(self, llm_service: LLMService):
+        """
+        Initialize the BatchService.
+
+        Args:
+            llm_service: LLMService providing the client and request settings
+        """
+        self.llm_service = llm_service
+        # In production, store jobs in Redis (REDIS_URL) so any worker can serve them
+        self.jobs = {}  # batch_id -> {"requests": {custom_id: {...}}, "status", "results"}
+
+    def _require_client(self):
+        """Raise if the LLM client is not configured."""
+        if not self.llm_service.client:
+            raise ValueError(
+                "LLM Service not properly initialized. "
+                "Ensure OPENAI_API_KEY is set in environment variables."
+            )
+
+    async def submit(self, career_analyses: List[dict], learning_paths: List[dict]) -> dict:
+        """
+        Submit career analyses and learning paths as one batch job.
+
+        Args:
+            career_analyses: Dicts with user_id, skills, experience_years, goals
+            learning_paths: Dicts with user_id, current_skills, target_role
+
+        Returns:
+            Batch id, status and number of requests
+
+        Raises:
+            ValueError: If the client is not configured, the batch is empty or
+                too large, or a prompt exceeds LLM_MAX_PROMPT_TOKENS
+        """
+        self._require_client()
+        if not career_analyses and not learning_paths:
+            raise ValueError("Batch must contain at least one request")
+        total = len(career_analyses) + len(learning_paths)
+        if total > MAX_BATCH_REQUESTS:
+            raise ValueError(f"Batch too large: {total} requests (limit {MAX_BATCH_REQUESTS})")
+
+        # Formatting and token-counting thousands of prompts would block the event loop
+        requests, lines = await anyio.to_thread.run_sync(
+            self._build_requests, career_analyses, learning_paths
+        )
+
+        client = self.llm_service.client
+        batch_file = await client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+        self.jobs[batch.id] = {"requests": requests, "status": batch.status, "results": None}
+        logger.info(f"✅ Submitted batch {batch.id} ({len(requests)} requests)")
+
+        return {"batch_id": batch.id, "status": batch.status, "requests": len(requests)}
+
+    def _build_requests(self, career_analyses: List[dict], learning_paths: List[dict]) -> tuple:
+        """Build the per-request metadata and JSONL lines for a batch."""
+        requests = {}
+        lines = []
+
+        for i, item in enumerate(career_analyses):
+            custom_id = f"career-{i}"
+            prompt = format_career_prompt(item["skills"], item["experience_years"], item["goals"])
+            requests[custom_id] = {"user_id": item["user_id"], "type": "career_analysis"}
+            lines.append(self._batch_line(custom_id, prompt, CAREER_SYSTEM_PROMPT))
+
+        for i, item in enumerate(learning_paths):
+            custom_id = f"learning-{i}"
+            prompt = format_learning_prompt(item["current_skills"], item["target_role"])
+            requests[custom_id] = {"user_id": item["user_id"], "type": "learning_path"}
+            lines.append(self._batch_line(custom_id, prompt, LEARNING_SYSTEM_PROMPT))
+
+        return requests, lines
+
+    def _batch_line(self, custom_id: str, prompt: str, system_prompt: str) -> str:
+        """Serialize one request as a Batch API JSONL line, rejecting oversize prompts."""
+        try:
+            self.llm_service._check_prompt_size(prompt, system_prompt)
+        except ValueError as e:
+            raise ValueError(f"{custom_id}: {str(e)}")
+        return json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": self.llm_service.chat_request(prompt, system_prompt)
+        })
+
+    async def get_status(self, batch_id: str) -> Optional[dict]:
+        """
+        Refresh a batch job from the API and collect results once it finishes.
+
+        Args:
+            batch_id: Id returned by submit()
+
+        Returns:
+            Job status with progress counts and, once finished, per-request results.
+            None if the batch id is unknown.
+        """
+        job = self.jobs.get(batch_id)
+        if job is None:
+            return None
+
+        if job["status"] not in FINAL_STATUSES:
+            self._require_client()
+            batch = await self.llm_service.client.batches.retrieve(batch_id)
+            job["counts"] = {
+                "total": batch.request_counts.total,
+                "completed": batch.request_counts.completed,
+                "failed": batch.request_counts.failed
+            } if batch.request_counts else None
+
+            if batch.status in FINAL_STATUSES:
+                job["results"] = await self._collect_results(batch_id, job, batch)
+            # Only record a final status once results are in, so a failed
+            # download is retried on the next poll
+            job["status"] = batch.status
+
+        return {
+            "batch_id": batch_id,
+            "status": job["status"],
+            "counts": job.get("counts"),
+            "results": job["results"]
+        }
+
+    async def _collect_results(self, batch_id: str, job: dict, batch) -> List[dict]:
+        """
+        Download the output and error files and map each result back to its user.
+
+        Successful requests are in the output file and failed ones in the
+        error file; requests in neither (e.g. the batch expired or was
+        cancelled first) are reported as failed too, so every user gets a result.
+        """
+        results = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            content = await self.llm_service.client.files.content(file_id)
+            for line in content.text.splitlines():
+                if line.strip():
+                    results.append(self._parse_result(job, json.loads(line)))
+
+        returned = {result["custom_id"] for result in results}
+        for custom_id, meta in job["requests"].items():
+            if custom_id not in returned:
+                results.append({
+                    "custom_id": custom_id,
+                    "user_id": meta["user_id"],
+                    "type": meta["type"],
+                    "success": False,
+                    "response": None,
+                    "tokens": None,
+                    "error": f"No result returned (batch {batch.status})"
+                })
+
+        logger.info(f"✅ Collected {len(results)} results for batch {batch_id}")
+        return results
+
+    def _parse_result(self, job: dict, record: dict) -> dict:
+        """Convert one output/error file record into a per-user result."""
+        meta = job["requests"].get(record["custom_id"], {})
+        response = record.get("response") or {}
+        body = response.get("body") or {}
+        error = record.get("error")
+
+        result = {
+            "custom_id": record["custom_id"],
+            "user_id": meta.get("user_id"),
+            "type": meta.get("type"),
+            "success": error is None and response.get("status_code") == 200,
+            "response": None,
+            "tokens": None
+        }
+        if result["success"]:
+            result["response"] = body["choices"][0]["message"]["content"]
+            result["tokens"] = body["usage"]["total_tokens"]
+        else:
+            result["error"] = (error or body.get("error") or {}).get("message", "Unknown error")
+        return result
@@ -5,12 +5,225 @@ Handles connections to OpenAI API or other LLM providers.
 Manages prompt engineering, token counting, and response parsing.
 """
 
+import asyncio
+import functools
+import itertools
 import os
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, List, Optional
 import logging
 
+import anyio.to_thread
+import msgspec
+
+from app.services.response_cache import ResponseCache, make_cache_key, make_namespace
+
 logger = logging.getLogger(__name__)
 
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Prompt constants and templates, built once at import time
+CAREER_SYSTEM_PROMPT = (
+    "You are an expert career coach with deep knowledge of industry trends, "
+    "skills development, and career progression. Provide actionable insights."
+)
+CAREER_PROMPT_TEMPLATE = """Please analyze this career profile and provide insights:
+
+Skills: {skills}
+Experience: {experience_years} years
+Goals: {goals}
+
+Provide:
+1. Skill gap analysis
+2. Career path recommendations
+3. Top 3 actionable next steps
+"""
+
+INTERVIEW_SYSTEM_PROMPT = (
+    "You are an experienced recruiter and technical interviewer. "
+    "Generate thoughtful, realistic interview questions. "
+    'Respond ONLY with JSON: {"questions": ["...", "..."]}'
+)
+INTERVIEW_PROMPT_TEMPLATE = """Generate 5 interview questions for a {level}-level {role} position.
+Include a mix of technical and behavioral questions.
+"""
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+LEARNING_SYSTEM_PROMPT = (
+    "You are a learning and development specialist. "
+    "Create structured, achievable learning paths with concrete milestones."
+)
+LEARNING_PROMPT_TEMPLATE = """Create a learning path from current skills to target role:
+
+Current Skills: {skills}
+Target Role: {target_role}
+
+Provide:
+1. Skills gap analysis
+2. Learning milestones (with timeframes)
+3. Recommended resources/courses
+4. Success metrics
+"""
+
+
+# Most list items (skills) included in a prompt
+MAX_PROMPT_ITEMS = 50
+
+
+class InterviewQuestions(msgspec.Struct):
+    """Structured interview questions returned by the LLM in JSON mode."""
+    questions: List[str]
+
+
+# Reusable typed decoder for InterviewQuestions
+_interview_decoder = msgspec.json.Decoder(InterviewQuestions)
+
+
+def format_career_prompt(skills: list, experience_years: int, goals: str) -> str:
+    """Fill the career analysis template (skills capped at MAX_PROMPT_ITEMS)."""
+    return CAREER_PROMPT_TEMPLATE.format(
+        skills=", ".join(skills[:MAX_PROMPT_ITEMS]) if skills else "None provided",
+        experience_years=experience_years,
+        goals=goals
+    )
+
+
+def format_learning_prompt(current_skills: list, target_role: str) -> str:
+    """Fill the learning path template (skills capped at MAX_PROMPT_ITEMS)."""
+    return LEARNING_PROMPT_TEMPLATE.format(
+        skills=", ".join(current_skills[:MAX_PROMPT_ITEMS]) if current_skills else "None",
+        target_role=target_role
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _encoding(model: str):
+    """Load the tokenizer for a model once per process (BPE parsing is expensive)."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _cache_hit(cached: dict) -> dict:
+    """Mark a cached result as a hit; no tokens were billed for it."""
+    return {**cached, "tokens": {"prompt": 0, "completion": 0, "total": 0}, "cached": True}
+
+
+def cached_response(func):
+    """
+    Serve LLM responses from the ResponseCache when possible.
+
+    Checks the exact-match tier first, then (only when the caller passes
+    semantic=True) the semantic tier. Only successful responses from the
+    primary endpoint are stored: keys include the primary model, so a
+    fallback model's answer must not be cached under them. Keys also include
+    the temperature and response format, so changing any of them never
+    returns stale entries. Hits report zero tokens, since nothing was billed.
+
+    The semantic tier is meant for free-form prompts: templated prompts are
+    mostly fixed text, so different profiles would look alike and could be
+    served another user's answer.
+
+    A `validate` callable is applied by the wrapped function before the
+    result counts as successful, so malformed or truncated answers are
+    never cached.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, prompt: str, system_prompt: Optional[str] = None,
+                      response_format: Optional[dict] = None, semantic: bool = False,
+                      validate: Optional[Callable[[str], Any]] = None) -> dict:
+        """
+        Call the wrapped function on a cache miss.
+
+        Takes the wrapped function's arguments, plus one decorator-only keyword.
+
+        Args:
+            semantic: Also look up similar prompts in the semantic cache
+                (free-form prompts only)
+        """
+        # Reject oversize prompts before any embedding or completion call
+        self._check_prompt_size(prompt, system_prompt)
+        if self.cache is None:
+            return await func(self, prompt, system_prompt, response_format, validate)
+
+        key = make_cache_key(self.model, system_prompt, prompt, self.temperature, response_format)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.info("✅ LLM response served from cache")
+            return _cache_hit(cached)
+
+        namespace = make_namespace(self.model, system_prompt, self.temperature, response_format)
+        vector = None
+        if semantic and self.cache.semantic_enabled:
+            vector = await self.cache.embed(prompt)
+        if vector is not None:
+            cached = self.cache.search(namespace, vector)
+            if cached is not None:
+                self.cache.set(key, cached)
+                return _cache_hit(cached)
+
+        result = await func(self, prompt, system_prompt, response_format, validate)
+        if result["success"] and result["endpoint"] == self.endpoints[0].name:
+            self.cache.set(key, result)
+            if vector is not None:
+                self.cache.add(namespace, vector, result)
+        return result
+
+    return wrapper
+
+
+class LLMEndpoint:
+    """One chat-completions endpoint (OpenAI, Azure OpenAI, vLLM...) in the client pool."""
+
+    def __init__(self, name: str, client, model: str, concurrency: int):
+        """
+        Initialize an endpoint.
+
+        Args:
+            name: Label used in logs and /status
+            client: AsyncOpenAI-compatible client
+            model: Model (or Azure deployment) name to request on this endpoint
+            concurrency: Maximum simultaneous requests to this endpoint
+        """
+        self.name = name
+        self.client = client
+        self.model = model
+        self.concurrency = concurrency
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.in_flight = 0  # running + waiting requests
+
+    @property
+    def free_slots(self) -> int:
+        """Unused capacity; negative when requests are queuing."""
+        return self.concurrency - self.in_flight
+
+    async def acquire(self):
+        """Take one of this endpoint's concurrency slots, waiting for a free one."""
+        self.in_flight += 1
+        try:
+            await self.semaphore.acquire()
+        except BaseException:
+            self.in_flight -= 1
+            raise
+
+    def release(self):
+        """Give back a slot taken with acquire()."""
+        self.semaphore.release()
+        self.in_flight -= 1
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one of this endpoint's concurrency slots."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
 
 class LLMService:
     """Service for interacting with Language Models (LLMs)."""
@@ -21,32 +234,306 @@ class LLMService:
         self.model = os.getenv("LLM_MODEL", "gpt-3.5-turbo")
         self.temperature = float(os.getenv("LLM_TEMPERATURE", "0.7"))
         self.max_tokens = int(os.getenv("LLM_MAX_TOKENS", "500"))
+        self.max_prompt_tokens = int(os.getenv("LLM_MAX_PROMPT_TOKENS", "3000"))
+        self.max_attempts = max(1, int(os.getenv("LLM_MAX_ATTEMPTS", "3")))
+        self.retry_backoff = float(os.getenv("LLM_RETRY_BACKOFF", "0.5"))
+        self.tokenizer_timeout = float(os.getenv("LLM_TOKENIZER_TIMEOUT", "10"))
+        self.tokenizer_retry_interval = float(os.getenv("LLM_TOKENIZER_RETRY_INTERVAL", "60"))
+
+        self.client = None
+        self.endpoints: List[LLMEndpoint] = []
+        self._http_client = None
+        self._retryable = ()
+        self._tokenizer = None  # set by load_tokenizer()
+        self._tokenizer_loading = False
+        self.cache = None
 
         if not self.api_key:
             logger.warning("⚠️ OPENAI_API_KEY not found in environment variables")
+        else:
+            self.connect()
+
+    def connect(self):
+        """
+        Create the shared HTTP connection pool and endpoint clients.
+
+        Called at construction and on application startup. Does nothing while
+        the pool is open; after aclose() it builds a fresh pool, so the service
+        can be reused across application lifespans.
+        """
+        if not self.api_key:
+            return
+        if self._http_client is not None and not self._http_client.is_closed:
+            return
+
+        try:
+            import httpx
+            from openai import (
+                APIConnectionError, AsyncAzureOpenAI, AsyncOpenAI,
+                InternalServerError, RateLimitError,
+            )
+            # One pooled keep-alive HTTP client shared by all endpoints
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+                timeout=60
+            )
+            # Keeps the SDK's default retries for batch and embedding calls
+            self.client = AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=self._http_client
+            )
+            self._retryable = (RateLimitError, APIConnectionError, InternalServerError)
+            self.endpoints = self._build_endpoints(AsyncAzureOpenAI, AsyncOpenAI)
+            logger.info(
+                f"✅ LLM Service initialized with model: {self.model} "
+                f"(endpoints: {', '.join(e.name for e in self.endpoints)})"
+            )
+        except ImportError:
+            logger.error("❌ OpenAI library not installed. Run: pip install openai")
             self.client = None
+            return
+
+        # Response cache (exact + semantic), only useful with a live client.
+        # Kept across reconnects; only its embeddings client is replaced.
+        # LLM_CACHE_MAX_ENTRIES=0 turns it off (TTLCache can't hold 0 entries).
+        if int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1024")) <= 0:
+            logger.info("LLM response cache disabled (LLM_CACHE_MAX_ENTRIES=0)")
+        elif self.cache is None:
+            self.cache = ResponseCache(self.client)
         else:
+            self.cache.client = self.client
+
+    def _build_endpoints(self, azure_client_cls, openai_client_cls) -> List[LLMEndpoint]:
+        """
+        Build the endpoint pool: OpenAI first, then optional fallbacks.
+
+        Azure OpenAI is added when AZURE_OPENAI_ENDPOINT is set, and a
+        self-hosted OpenAI-compatible server (e.g. vLLM) when VLLM_BASE_URL is set.
+        A fallback that cannot be configured (e.g. missing credentials) is
+        logged and skipped rather than taking the service down.
+
+        Failover is handled by the pool, so endpoint clients don't retry on
+        their own; the primary gets a no-retry copy of the shared client.
+        """
+        endpoints = [LLMEndpoint(
+            "openai", self.client.with_options(max_retries=0), self.model,
+            int(os.getenv("LLM_CONCURRENCY", "50"))
+        )]
+
+        azure_endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
+        if azure_endpoint:
+            try:
+                endpoints.append(LLMEndpoint(
+                    "azure",
+                    azure_client_cls(
+                        azure_endpoint=azure_endpoint,
+                        api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+                        api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-01"),
+                        http_client=self._http_client,
+                        max_retries=0
+                    ),
+                    os.getenv("AZURE_OPENAI_DEPLOYMENT") or self.model,
+                    int(os.getenv("AZURE_OPENAI_CONCURRENCY", "50"))
+                ))
+            except Exception as e:
+                logger.warning(f"⚠️ Azure OpenAI fallback disabled: {str(e)}")
+
+        vllm_base_url = os.getenv("VLLM_BASE_URL")
+        if vllm_base_url:
             try:
-                from openai import OpenAI
-                self.client = OpenAI(api_key=self.api_key)
-                logger.info(f"✅ LLM Service initialized with model: {self.model}")
-            except ImportError:
-                logger.error("❌ OpenAI library not installed. Run: pip install openai")
-                self.client = None
+                endpoints.append(LLMEndpoint(
+                    "vllm",
+                    openai_client_cls(
+                        base_url=vllm_base_url,
+                        api_key=os.getenv("VLLM_API_KEY") or "EMPTY",
+                        http_client=self._http_client,
+                        max_retries=0
+                    ),
+                    os.getenv("VLLM_MODEL") or self.model,
+                    int(os.getenv("VLLM_CONCURRENCY", "16"))
+                ))
+            except Exception as e:
+                logger.warning(f"⚠️ vLLM fallback disabled: {str(e)}")
+
+        return endpoints
+
+    async def _complete(self, request: dict, hold_slot: bool = False, **kwargs):
+        """
+        Call chat completions on the least busy endpoint, failing over on errors.
+
+        Endpoints are tried in order of free capacity. Rate limits, connection
+        errors and 5xx responses move on to the next endpoint after an
+        exponential backoff, up to LLM_MAX_ATTEMPTS attempts in total.
 
-    def generate_response(self, prompt: str, system_prompt: Optional[str] = None) -> dict:
+        Args:
+            request: Body from chat_request() (its model is replaced per endpoint)
+            hold_slot: Keep the endpoint's concurrency slot after returning; the
+                caller must call endpoint.release() (streams generate after create())
+            **kwargs: Extra arguments for chat.completions.create (e.g. stream=True)
+
+        Returns:
+            (completion or stream, endpoint) from the first endpoint that succeeds
+        """
+        # sorted() is stable, so ties keep the configured (primary-first) order
+        order = sorted(self.endpoints, key=lambda e: e.free_slots, reverse=True)
+        attempts = itertools.islice(itertools.cycle(order), self.max_attempts)
+
+        for attempt, endpoint in enumerate(attempts):
+            if attempt:
+                await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+            await endpoint.acquire()
+            try:
+                response = await endpoint.client.chat.completions.create(
+                    **{**request, "model": endpoint.model},
+                    **kwargs
+                )
+            except self._retryable as e:
+                endpoint.release()
+                if attempt + 1 >= self.max_attempts:
+                    raise
+                logger.warning(f"⚠️ LLM endpoint '{endpoint.name}' failed ({type(e).__name__}), failing over")
+                continue
+            except BaseException:
+                endpoint.release()
+                raise
+            if not hold_slot:
+                endpoint.release()
+            return response, endpoint
+
+    def load_tokenizer(self) -> bool:
+        """
+        Load the model's tokenizer so count_tokens() can use it.
+
+        Blocking: on first use tiktoken downloads the encoding file, so call
+        this from a worker thread (see warm_tokenizer()).
+
+        Returns:
+            True if the tokenizer is loaded
+        """
+        if tiktoken is None:
+            return False
+        self._tokenizer_loading = True
+        try:
+            self._tokenizer = _encoding(self.model)
+            logger.info(f"✅ Tokenizer loaded for model: {self.model}")
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Tokenizer unavailable, skipping prompt size checks: {str(e)}")
+            return False
+        finally:
+            self._tokenizer_loading = False
+
+    async def warm_tokenizer(self):
+        """
+        Load the tokenizer in the background until it succeeds.
+
+        Each attempt runs in a worker thread and is waited on for at most
+        LLM_TOKENIZER_TIMEOUT seconds; failed attempts are retried every
+        LLM_TOKENIZER_RETRY_INTERVAL seconds. An attempt still stuck in its
+        download is left to finish rather than started again. Run as a task
+        from the application lifespan.
+        """
+        while tiktoken is not None and self._tokenizer is None:
+            if not self._tokenizer_loading:
+                self._tokenizer_loading = True
+                with anyio.move_on_after(self.tokenizer_timeout):
+                    await anyio.to_thread.run_sync(self.load_tokenizer, cancellable=True)
+                if self._tokenizer_loading:
+                    logger.warning(
+                        f"⚠️ Tokenizer still loading after {self.tokenizer_timeout}s, "
+                        f"skipping prompt size checks until it is ready"
+                    )
+            if self._tokenizer is None:
+                await asyncio.sleep(self.tokenizer_retry_interval)
+
+    def count_tokens(self, text: str) -> Optional[int]:
+        """
+        Count tokens locally with the model's tokenizer.
+
+        Args:
+            text: Text to tokenize
+
+        Returns:
+            Token count, or None until the tokenizer has been loaded
+            (tiktoken missing, or the encoding not downloaded yet)
+        """
+        if self._tokenizer is None:
+            return None
+        # User text may contain special-token strings; count them as plain text
+        return len(self._tokenizer.encode(text, disallowed_special=()))
+
+    def _check_prompt_size(self, prompt: str, system_prompt: Optional[str]):
+        """Reject prompts over LLM_MAX_PROMPT_TOKENS before calling the API."""
+        tokens = self.count_tokens(prompt)
+        if tokens is None:
+            return
+        if system_prompt:
+            tokens += self.count_tokens(system_prompt) or 0
+        if tokens > self.max_prompt_tokens:
+            raise ValueError(
+                f"Prompt too long: {tokens} tokens (limit {self.max_prompt_tokens})"
+            )
+
+    def chat_request(self, prompt: str, system_prompt: Optional[str] = None,
+                     response_format: Optional[dict] = None) -> dict:
+        """
+        Build the chat completions request body for a prompt.
+
+        Args:
+            prompt: User prompt/question
+            system_prompt: Optional system context for the model
+            response_format: Optional output format (e.g. JSON_RESPONSE_FORMAT)
+
+        Returns:
+            Keyword arguments for chat.completions.create (also used as Batch API bodies)
+        """
+        messages = []
+
+        # Add system prompt if provided
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+
+        # Add user prompt
+        messages.append({"role": "user", "content": prompt})
+
+        request = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens
+        }
+        if response_format:
+            request["response_format"] = response_format
+        return request
+
+    async def aclose(self):
+        """Close the shared HTTP connection pool. Call on application shutdown (see connect())."""
+        if self._http_client:
+            await self._http_client.aclose()
+
+    @cached_response  # also enforces LLM_MAX_PROMPT_TOKENS
+    async def generate_response(self, prompt: str, system_prompt: Optional[str] = None,
+                                response_format: Optional[dict] = None,
+                                validate: Optional[Callable[[str], Any]] = None) -> dict:
         """
         Generate a response from the LLM.
 
+        Callers may also pass semantic=True, a keyword taken by the
+        cached_response decorator rather than this function.
+
         Args:
             prompt: User prompt/question
             system_prompt: Optional system context for the model
+            response_format: Optional output format (e.g. JSON_RESPONSE_FORMAT)
+            validate: Optional parser for the response content; if it raises,
+                the result is unsuccessful (and not cached), otherwise its
+                return value is included as "parsed"
 
         Returns:
             Dictionary with response, tokens used, and metadata
 
         Raises:
-            ValueError: If API key not configured
+            ValueError: If API key not configured or the prompt is too long
             Exception: If API call fails
         """
         if not self.client:
@@ -56,29 +543,28 @@ class LLMService:
             )
 
         try:
-            messages = []
-
-            # Add system prompt if provided
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-
-            # Add user prompt
-            messages.append({"role": "user", "content": prompt})
-
             # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens
+            response, endpoint = await self._complete(
+                self.chat_request(prompt, system_prompt, response_format)
             )
 
             # Extract response content
             content = response.choices[0].message.content
 
+            parsed = None
+            if validate is not None:
+                try:
+                    parsed = validate(content)
+                except Exception as e:
+                    # e.g. JSON cut off by max_tokens (finish_reason "length")
+                    raise ValueError(
+                        f"Invalid response from model "
+                        f"(finish_reason: {response.choices[0].finish_reason}): {str(e)}"
+                    )
+
             logger.info(f"✅ LLM response generated ({response.usage.total_tokens} tokens)")
 
-            return {
+            result = {
                 "success": True,
                 "response": content,
                 "tokens": {
@@ -86,8 +572,12 @@ class LLMService:
                     "completion": response.usage.completion_tokens,
                     "total": response.usage.total_tokens
                 },
-                "model": self.model
+                "model": endpoint.model,
+                "endpoint": endpoint.name
             }
+            if validate is not None:
+                result["parsed"] = parsed
+            return result
 
         except Exception as e:
             logger.error(f"❌ LLM API Error: {str(e)}")
@@ -97,7 +587,60 @@ class LLMService:
                 "response": None
             }
 
-    def analyze_career_profile(self, skills: list, experience_years: int, goals: str) -> dict:
+    def generate_response_stream(self, prompt: str, system_prompt: Optional[str] = None,
+                                 response_format: Optional[dict] = None) -> AsyncIterator[str]:
+        """
+        Stream a response from the LLM as it is generated.
+
+        Args:
+            prompt: User prompt/question
+            system_prompt: Optional system context for the model
+            response_format: Optional output format (e.g. JSON_RESPONSE_FORMAT)
+
+        Returns:
+            Async iterator of text chunks
+
+        Raises:
+            ValueError: If API key not configured or the prompt is too long
+        """
+        if not self.client:
+            raise ValueError(
+                "LLM Service not properly initialized. "
+                "Ensure OPENAI_API_KEY is set in environment variables."
+            )
+        self._check_prompt_size(prompt, system_prompt)
+        return self._stream(prompt, system_prompt, response_format)
+
+    async def _stream(self, prompt: str, system_prompt: Optional[str],
+                      response_format: Optional[dict]) -> AsyncIterator[str]:
+        """Yield text chunks for a prompt, serving exact cache hits in one chunk."""
+        if self.cache is not None:
+            cached = self.cache.get(make_cache_key(
+                self.model, system_prompt, prompt, self.temperature, response_format
+            ))
+            if cached is not None:
+                logger.info("✅ LLM response served from cache")
+                yield cached["response"]
+                return
+
+        # Failover applies until the stream opens; the endpoint's slot is held
+        # until generation ends, so streams count against its concurrency
+        stream, endpoint = await self._complete(
+            self.chat_request(prompt, system_prompt, response_format),
+            hold_slot=True,
+            stream=True
+        )
+        try:
+            # Closing the stream on disconnect or error releases the pooled
+            # connection and stops OpenAI generating (and billing) more tokens
+            async with stream:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+        finally:
+            endpoint.release()
+
+    async def analyze_career_profile(self, skills: list, experience_years: int, goals: str, stream: bool = False):
         """
         Analyze a career profile and provide AI-powered insights.
 
@@ -105,85 +648,50 @@ class LLMService:
             skills: List of user skills
             experience_years: Years of experience
             goals: Career goals description
+            stream: Return an async iterator of text chunks instead of waiting
 
         Returns:
             Career analysis and recommendations
         """
-        skills_text = ", ".join(skills) if skills else "None provided"
-
-        system_prompt = (
-            "You are an expert career coach with deep knowledge of industry trends, "
-            "skills development, and career progression. Provide actionable insights."
-        )
-
-        prompt = f"""
-        Please analyze this career profile and provide insights:
-
-        Skills: {skills_text}
-        Experience: {experience_years} years
-        Goals: {goals}
-
-        Provide:
-        1. Skill gap analysis
-        2. Career path recommendations
-        3. Top 3 actionable next steps
-        """
-
-        return self.generate_response(prompt, system_prompt)
+        prompt = format_career_prompt(skills, experience_years, goals)
+        if stream:
+            return self.generate_response_stream(prompt, CAREER_SYSTEM_PROMPT)
+        return await self.generate_response(prompt, CAREER_SYSTEM_PROMPT)
 
-    def generate_interview_questions(self, role: str, level: str) -> dict:
+    async def generate_interview_questions(self, role: str, level: str, stream: bool = False):
         """
         Generate interview preparation questions for a specific role.
 
         Args:
             role: Job title/role
             level: Experience level (junior/mid/senior)
+            stream: Return an async iterator of text chunks instead of waiting
 
         Returns:
-            List of interview questions
+            Response whose content is JSON: {"questions": [...]}, decoded
+            into an InterviewQuestions as "parsed" (invalid JSON is a failure)
         """
-        system_prompt = (
-            "You are an experienced recruiter and technical interviewer. "
-            "Generate thoughtful, realistic interview questions."
+        prompt = INTERVIEW_PROMPT_TEMPLATE.format(level=level, role=role)
+        if stream:
+            return self.generate_response_stream(prompt, INTERVIEW_SYSTEM_PROMPT, JSON_RESPONSE_FORMAT)
+        return await self.generate_response(
+            prompt, INTERVIEW_SYSTEM_PROMPT, JSON_RESPONSE_FORMAT,
+            validate=_interview_decoder.decode
         )
 
-        prompt = f"""
-        Generate 5 interview questions for a {level}-level {role} position.
-        Include a mix of technical and behavioral questions.
-        Format each question clearly.
-        """
-
-        return self.generate_response(prompt, system_prompt)
-
-    def create_learning_path(self, current_skills: list, target_role: str) -> dict:
+    async def create_learning_path(self, current_skills: list, target_role: str, stream: bool = False):
         """
         Create a personalized learning path to reach a target role.
 
         Args:
             current_skills: Current skill set
             target_role: Target job role
+            stream: Return an async iterator of text chunks instead of waiting
 
         Returns:
             Structured learning path with milestones
         """
-        skills_text = ", ".join(current_skills) if current_skills else "None"
-
-        system_prompt = (
-            "You are a learning and development specialist. "
-            "Create structured, achievable learning paths with concrete milestones."
-        )
-
-        prompt = f"""
-        Create a learning path from current skills to target role:
-
-        Current Skills: {skills_text}
-        Target Role: {target_role}
-
-        Provide:
-        1. Skills gap analysis
-        2. Learning milestones (with timeframes)
-        3. Recommended resources/courses
-        4. Success metrics
-        """
-
-        return self.generate_response(prompt, system_prompt)
+        prompt = format_learning_prompt(current_skills, target_role)
+        if stream:
+            return self.generate_response_stream(prompt, LEARNING_SYSTEM_PROMPT)
+        return await self.generate_response(prompt, LEARNING_SYSTEM_PROMPT)
@@ -0,0 +1,229 @@
+"""
+Response cache for LLM completions.
+
+Two-tier cache in front of the LLM API:
+- Exact tier: TTL cache keyed by a hash of
+  (model, system_prompt, prompt, temperature, response_format)
+- Semantic tier: embedding similarity search (FAISS inner-product index)
+  for free-form prompts that are worded differently but mean the same thing.
+  Templated prompts must not use it: they are mostly fixed text, so two
+  different profiles can clear the similarity threshold.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from typing import List, Optional
+
+import orjson
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(model: str, system_prompt: Optional[str], prompt: str, temperature: float,
+                   response_format: Optional[dict] = None) -> str:
+    """
+    Build the exact-match cache key for a completion request.
+
+    Args:
+        model: Model name
+        system_prompt: Optional system context
+        prompt: User prompt
+        temperature: Sampling temperature
+        response_format: Optional output format (JSON-mode and text answers differ)
+
+    Returns:
+        Hex digest identifying the request
+    """
+    # JSON keeps fields apart (no separator collisions) and None distinct from "None"
+    raw = orjson.dumps(
+        [model, system_prompt, prompt, temperature, response_format],
+        option=orjson.OPT_SORT_KEYS
+    )
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def make_namespace(model: str, system_prompt: Optional[str], temperature: float,
+                   response_format: Optional[dict] = None) -> str:
+    """
+    Build the semantic-tier namespace for a completion request.
+
+    Prompts are only compared against prompts sent with the same model,
+    system prompt, temperature and response format.
+    """
+    return make_cache_key(model, system_prompt, "", temperature, response_format)
+
+
+class _SemanticIndex:
+    """FAISS inner-product index over normalized prompt embeddings for one namespace."""
+
+    def __init__(self, faiss, dimension: int, ttl: int):
+        self.faiss = faiss
+        self.ttl = ttl
+        self.index = faiss.IndexFlatIP(dimension)
+        self.entries: List[tuple] = []  # (expires_at, response), in insertion order
+
+    def search(self, vector) -> tuple:
+        """Return (similarity, response) of the closest live entry, or (0.0, None)."""
+        self.expire()
+        if not self.entries:
+            return 0.0, None
+        scores, ids = self.index.search(vector, 1)
+        idx = int(ids[0][0])
+        if idx < 0:
+            return 0.0, None
+        return float(scores[0][0]), self.entries[idx][1]
+
+    @property
+    def oldest(self) -> float:
+        """Expiry time of the oldest entry (entries share one TTL, so also the first added)."""
+        return self.entries[0][0]
+
+    def add(self, vector, response: dict):
+        """Add an entry (ResponseCache enforces the size limit)."""
+        self.index.add(vector)
+        self.entries.append((time.monotonic() + self.ttl, response))
+
+    def expire(self):
+        """Drop entries whose TTL has elapsed (oldest entries come first)."""
+        now = time.monotonic()
+        count = 0
+        while count < len(self.entries) and self.entries[count][0] <= now:
+            count += 1
+        if count:
+            self.evict(count)
+
+    def evict(self, count: int):
+        """Remove the `count` oldest entries."""
+        self.index.remove_ids(self.faiss.IDSelectorRange(0, count))
+        del self.entries[:count]
+
+
+class ResponseCache:
+    """Two-tier (exact + semantic) cache for LLM responses."""
+
+    def __init__(self, client=None, semantic: Optional[bool] = None):
+        """
+        Initialize the response cache from environment configuration.
+
+        Args:
+            client: AsyncOpenAI client used to compute prompt embeddings
+            semantic: Override for LLM_SEMANTIC_CACHE (enables the semantic tier)
+        """
+        self.client = client
+        self.ttl = int(os.getenv("LLM_CACHE_TTL", "3600"))
+        self.max_entries = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1024"))
+        self.threshold = float(os.getenv("LLM_CACHE_SIMILARITY_THRESHOLD", "0.95"))
+        self.embedding_model = os.getenv("LLM_EMBEDDING_MODEL", "text-embedding-3-small")
+
+        self.exact = TTLCache(maxsize=self.max_entries, ttl=self.ttl)
+        self.indexes = {}
+
+        if semantic is None:
+            semantic = os.getenv("LLM_SEMANTIC_CACHE", "True").lower() == "true"
+
+        self.faiss = None
+        self.np = None
+        if semantic and client is not None:
+            try:
+                import faiss
+                import numpy as np
+                self.faiss = faiss
+                self.np = np
+            except ImportError:
+                logger.warning("⚠️ faiss/numpy not installed, semantic cache disabled")
+
+    @property
+    def semantic_enabled(self) -> bool:
+        """Whether the semantic tier is active."""
+        return self.faiss is not None
+
+    def get(self, key: str) -> Optional[dict]:
+        """Look up an exact-match entry."""
+        return self.exact.get(key)
+
+    def set(self, key: str, response: dict):
+        """Store an exact-match entry."""
+        self.exact[key] = response
+
+    async def embed(self, text: str):
+        """
+        Compute a normalized embedding for a prompt.
+
+        Returns:
+            1 x d float32 array, or None if the embedding call fails
+        """
+        try:
+            result = await self.client.embeddings.create(model=self.embedding_model, input=text)
+        except Exception as e:
+            logger.warning(f"⚠️ Embedding failed, skipping semantic cache: {str(e)}")
+            return None
+
+        vector = self.np.asarray([result.data[0].embedding], dtype="float32")
+        self.faiss.normalize_L2(vector)
+        return vector
+
+    def search(self, namespace: str, vector) -> Optional[dict]:
+        """
+        Find a cached response for a semantically similar prompt.
+
+        Args:
+            namespace: Namespace from make_namespace()
+            vector: Normalized prompt embedding
+
+        Returns:
+            Cached response if similarity exceeds the threshold, else None
+        """
+        index = self.indexes.get(namespace)
+        if index is None:
+            return None
+
+        similarity, response = index.search(vector)
+        if not index.entries:
+            del self.indexes[namespace]
+        if similarity > self.threshold:
+            logger.info(f"✅ Semantic cache hit (similarity {similarity:.3f})")
+            return response
+        return None
+
+    def add(self, namespace: str, vector, response: dict):
+        """
+        Store a response in the semantic tier.
+
+        LLM_CACHE_MAX_ENTRIES caps the entries across all namespaces, so
+        callers sending many distinct system prompts can't grow memory
+        without bound; the oldest entry overall is evicted first.
+        """
+        self._expire()
+        size = sum(len(index.entries) for index in self.indexes.values())
+        while self.indexes and size >= self.max_entries:
+            oldest_namespace = min(self.indexes, key=lambda ns: self.indexes[ns].oldest)
+            self._evict(oldest_namespace, 1)
+            size -= 1
+
+        index = self.indexes.get(namespace)
+        if index is None:
+            index = _SemanticIndex(self.faiss, vector.shape[1], self.ttl)
+            self.indexes[namespace] = index
+        index.add(vector, response)
+
+    def _expire(self):
+        """Drop expired semantic entries, and indexes left empty, in every namespace."""
+        for namespace in list(self.indexes):
+            self.indexes[namespace].expire()
+            if not self.indexes[namespace].entries:
+                del self.indexes[namespace]
+
+    def _evict(self, namespace: str, count: int):
+        """Remove the `count` oldest entries of a namespace, dropping it once empty."""
+        index = self.indexes[namespace]
+        index.evict(count)
+        if not index.entries:
+            del self.indexes[namespace]
+
+    def clear(self):
+        """Drop all cached entries."""
+        self.exact.clear()
+        self.indexes.clear()
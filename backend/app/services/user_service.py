@@ -5,8 +5,10 @@ Handles user creation, retrieval, updates, and authentication.
 Acts as the business logic layer between routes and database.
 """
 
+import itertools
+from datetime import datetime
 from typing import Optional
-from app.models.user import UserCreate, UserUpdate
+from app.models.user import UserCreate, UserResponse, UserUpdate
 
 
 class UserService:
@@ -16,8 +18,10 @@ class UserService:
         """Initialize the UserService."""
         # In production, initialize database session here
         self.users_db = {}  # Placeholder for in-memory storage
+        self._email_index = {}  # email -> user id, kept in sync with users_db
+        self._id_gen = itertools.count(1)  # ids are never reused, even after deletes
 
-    def create_user(self, user_data: UserCreate) -> dict:
+    def create_user(self, user_data: UserCreate) -> UserResponse:
         """
         Create a new user.
 
@@ -26,17 +30,26 @@ class UserService:
 
         Returns:
             Created user object
+
+        Raises:
+            ValueError: If the email is already registered
         """
+        if user_data.email in self._email_index:
+            raise ValueError("Email already registered")
+
         # TODO: Hash password and save to database
         user = {
-            "id": len(self.users_db) + 1,
+            "id": next(self._id_gen),
             "email": user_data.email,
-            "full_name": user_data.full_name
+            "full_name": user_data.full_name,
+            "created_at": datetime.utcnow()
         }
         self.users_db[user["id"]] = user
-        return user
+        self._email_index[user["email"]] = user["id"]
+        # Data we just built is trusted, so skip re-validation
+        return UserResponse.model_construct(**user)
 
-    def get_user(self, user_id: int) -> Optional[dict]:
+    def get_user(self, user_id: int) -> Optional[UserResponse]:
         """
         Retrieve user by ID.
 
@@ -46,7 +59,8 @@ class UserService:
         Returns:
             User object or None if not found
         """
-        return self.users_db.get(user_id)
+        user = self.users_db.get(user_id)
+        return UserResponse.model_construct(**user) if user else None
 
     def get_user_by_email(self, email: str) -> Optional[dict]:
         """
@@ -58,12 +72,10 @@ class UserService:
         Returns:
             User object or None if not found
         """
-        for user in self.users_db.values():
-            if user.get("email") == email:
-                return user
-        return None
+        user_id = self._email_index.get(email)
+        return self.users_db.get(user_id) if user_id is not None else None
 
-    def update_user(self, user_id: int, user_data: UserUpdate) -> Optional[dict]:
+    def update_user(self, user_id: int, user_data: UserUpdate) -> Optional[UserResponse]:
         """
         Update user information.
 
@@ -73,17 +85,26 @@ class UserService:
 
         Returns:
             Updated user object or None if not found
+
+        Raises:
+            ValueError: If the new email belongs to another user
         """
         user = self.users_db.get(user_id)
         if not user:
             return None
 
+        # Check before changing anything, so a rejected update leaves the user as-is
+        if user_data.email and self._email_index.get(user_data.email, user_id) != user_id:
+            raise ValueError("Email already registered")
+
         if user_data.full_name:
             user["full_name"] = user_data.full_name
-        if user_data.email:
+        if user_data.email and user_data.email != user["email"]:
+            del self._email_index[user["email"]]
+            self._email_index[user_data.email] = user_id
             user["email"] = user_data.email
 
-        return user
+        return UserResponse.model_construct(**user)
 
     def delete_user(self, user_id: int) -> bool:
         """
@@ -96,6 +117,7 @@ class UserService:
             True if deleted, False if not found
         """
         if user_id in self.users_db:
-            del self.users_db[user_id]
+            user = self.users_db.pop(user_id)
+            self._email_index.pop(user["email"], None)
             return True
         return False
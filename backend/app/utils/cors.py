@@ -0,0 +1,29 @@
+"""
+CORS middleware with constant-time origin and header checks.
+
+Starlette's CORSMiddleware scans lists for every cross-origin request
+and preflight; this subclass freezes them into sets once at startup.
+"""
+
+from typing import Iterable
+
+from starlette.middleware.cors import CORSMiddleware
+
+
+class PrecomputedCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware using frozenset lookups for allowed origins and headers."""
+
+    def __init__(self, app, allow_origins: Iterable[str] = (), **kwargs):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: ASGI application
+            allow_origins: Allowed origins ("*" allows all)
+            **kwargs: Remaining CORSMiddleware options
+        """
+        allow_origins = frozenset(allow_origins)
+        super().__init__(app, allow_origins=allow_origins, **kwargs)
+        # is_allowed_origin() and the preflight header check both use `in`,
+        # so frozensets make them O(1)
+        self.allow_headers = frozenset(self.allow_headers)
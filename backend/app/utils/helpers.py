@@ -6,6 +6,7 @@ and other frequently used operations.
 """
 
 import logging
+import time
 from datetime import datetime
 from typing import Any, Dict
 
@@ -13,6 +14,22 @@ from typing import Any, Dict
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# (unix second, ISO string) of the last formatted timestamp
+_ts_cache = (0, "")
+
+
+def _now_iso() -> str:
+    """
+    Current UTC time as an ISO string, truncated to the second.
+
+    The string is only re-formatted when the second changes.
+    """
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, datetime.utcfromtimestamp(now).isoformat())
+    return _ts_cache[1]
+
 
 def format_response(data: Any, message: str = None, success: bool = True) -> Dict:
     """
@@ -30,7 +47,7 @@ def format_response(data: Any, message: str = None, success: bool = True) -> Dic
         "success": success,
         "message": message,
         "data": data,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": _now_iso()
     }
 
 
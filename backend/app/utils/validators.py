@@ -6,8 +6,29 @@ and other input validation operations.
 """
 
 import re
+import string
 from typing import Tuple
 
+# Patterns compiled once at import time
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_PHONE_RE = re.compile(r"^\+?1?\d{9,15}$")
+
+# Password character classes as bits, checked in a single pass
+_UPPER, _LOWER, _DIGIT, _SPECIAL = 1, 2, 4, 8
+_ALL_CLASSES = _UPPER | _LOWER | _DIGIT | _SPECIAL
+_CHAR_CLASS = {
+    **dict.fromkeys(string.ascii_uppercase, _UPPER),
+    **dict.fromkeys(string.ascii_lowercase, _LOWER),
+    **dict.fromkeys(string.digits, _DIGIT),
+    **dict.fromkeys('!@#$%^&*(),.?":{}|<>', _SPECIAL),
+}
+_PASSWORD_ERRORS = (
+    (_UPPER, "Password must contain an uppercase letter"),
+    (_LOWER, "Password must contain a lowercase letter"),
+    (_DIGIT, "Password must contain a digit"),
+    (_SPECIAL, "Password must contain a special character"),
+)
+
 
 def validate_email(email: str) -> Tuple[bool, str]:
     """
@@ -19,8 +40,7 @@ def validate_email(email: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    if re.match(pattern, email):
+    if _EMAIL_RE.match(email):
         return True, ""
     return False, "Invalid email format"
 
@@ -44,14 +64,21 @@ def validate_password(password: str) -> Tuple[bool, str]:
     """
     if len(password) < 8:
         return False, "Password must be at least 8 characters"
-    if not re.search(r"[A-Z]", password):
-        return False, "Password must contain an uppercase letter"
-    if not re.search(r"[a-z]", password):
-        return False, "Password must contain a lowercase letter"
-    if not re.search(r"\d", password):
-        return False, "Password must contain a digit"
-    if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", password):
-        return False, "Password must contain a special character"
+
+    # One walk over the string, stopping as soon as every class has been seen
+    mask = 0
+    for char in password:
+        bit = _CHAR_CLASS.get(char)
+        if bit is None:
+            # Non-ASCII digits still count, as with the `\d` regex
+            bit = _DIGIT if char.isdecimal() else 0
+        mask |= bit
+        if mask == _ALL_CLASSES:
+            return True, ""
+
+    for bit, error in _PASSWORD_ERRORS:
+        if not mask & bit:
+            return False, error
     return True, ""
 
 
@@ -65,5 +92,4 @@ def validate_phone(phone: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    pattern = r"^\+?1?\d{9,15}$"
-    return bool(re.match(pattern, phone))
+    return bool(_PHONE_RE.match(phone))
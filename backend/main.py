@@ -9,15 +9,19 @@ Initializes the FastAPI app with:
 - Health check endpoints
 """
 
+import asyncio
 import os
+import sys
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
+import orjson
 from dotenv import load_dotenv
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 
 from app.routes import health, users, assessments, recommendations, ai
+from app.utils.cors import PrecomputedCORSMiddleware
 
 # Load environment variables from .env file
 load_dotenv()
@@ -26,10 +30,23 @@ load_dotenv()
 DEBUG = os.getenv("DEBUG", "True").lower() == "true"
 API_HOST = os.getenv("API_HOST", "0.0.0.0")
 API_PORT = int(os.getenv("API_PORT", 8000))
+# Each worker keeps its own in-memory state (users, LLM cache), so only
+# raise this once that state lives in a shared store
+API_WORKERS = int(os.getenv("API_WORKERS", 1))
+# Threads available to sync handlers/dependencies and anyio.to_thread calls
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", 40))
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 
-# CORS configuration
-ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "*").split(",")
+# CORS configuration (comma-separated; whitespace around entries is ignored)
+ALLOWED_ORIGINS = frozenset(
+    o.strip() for o in os.getenv("ALLOWED_ORIGINS", "*").split(",") if o.strip()
+)
+ALLOWED_HEADERS = [
+    h.strip() for h in os.getenv("ALLOWED_HEADERS", "authorization,content-type").split(",") if h.strip()
+]
+
+# Pre-serialized /ping body
+PING_BODY = orjson.dumps({"status": "pong"})
 
 
 @asynccontextmanager
@@ -40,8 +57,18 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     print(f"🚀 Starting AI-Smart-Career-Coach API in {ENVIRONMENT} mode")
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    # Build the OpenAPI schema now rather than on the first /docs request
+    app.openapi()
+    # (Re)open the LLM connection pool; it is closed again on shutdown
+    ai.llm_service.connect()
+    # Load the tokenizer in the background (tiktoken may download it on first use);
+    # prompt size checks are skipped until it is ready
+    tokenizer_task = asyncio.create_task(ai.llm_service.warm_tokenizer())
     yield
     # Shutdown
+    tokenizer_task.cancel()
+    await ai.llm_service.aclose()
     print("🛑 Shutting down API")
 
 
@@ -51,16 +78,17 @@ app = FastAPI(
     description="Intelligent career coaching powered by AI",
     version="1.0.0",
     debug=DEBUG,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS (Cross-Origin Resource Sharing)
 app.add_middleware(
-    CORSMiddleware,
+    PrecomputedCORSMiddleware,
     allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
+    allow_headers=ALLOWED_HEADERS,
 )
 
 
@@ -69,7 +97,7 @@ app.add_middleware(
 async def general_exception_handler(request, exc):
     """Handle unexpected exceptions with proper error response."""
     print(f"❌ Exception: {str(exc)}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -85,7 +113,7 @@ async def ping():
     Lightweight health check endpoint.
     Used by load balancers and monitoring services.
     """
-    return {"status": "pong"}
+    return Response(PING_BODY, media_type="application/json")
 
 
 @app.get("/")
@@ -117,5 +145,8 @@ if __name__ == "__main__":
         host=API_HOST,
         port=API_PORT,
         reload=DEBUG,
+        workers=1 if DEBUG else API_WORKERS,  # reload only supports one worker
+        loop="asyncio" if sys.platform == "win32" else "uvloop",  # uvloop has no Windows build
+        http="httptools",
         log_level="info"
     )
@@ -0,0 +1,5 @@
+"""
+Test package.
+
+Unit tests for the services, run with stubbed LLM clients (no network).
+"""
@@ -0,0 +1,126 @@
+"""
+Shared fixtures: a fake OpenAI client and an LLMService wired to it.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+from app.services.llm_service import LLMEndpoint, LLMService
+from app.services.response_cache import ResponseCache
+
+
+def make_completion(content: str, model: str = "gpt-3.5-turbo", finish_reason: str = "stop"):
+    """Build an object shaped like a chat completion."""
+    return SimpleNamespace(
+        model=model,
+        choices=[SimpleNamespace(
+            message=SimpleNamespace(content=content),
+            finish_reason=finish_reason
+        )],
+        usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5, total_tokens=15)
+    )
+
+
+def api_error(cls, status_code: int):
+    """Build an openai APIStatusError subclass (e.g. RateLimitError) for a status code."""
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    return cls("error", response=httpx.Response(status_code, request=request), body=None)
+
+
+class FakeStream:
+    """Streaming completion stand-in yielding text chunks (exceptions among them are raised)."""
+
+    def __init__(self, chunks, gate: asyncio.Event = None):
+        self.chunks = list(chunks)
+        self.gate = gate  # when set, each chunk waits for it
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            if self.gate is not None:
+                await self.gate.wait()
+            if isinstance(chunk, BaseException):
+                raise chunk
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=chunk))])
+
+
+class FakeCompletions:
+    """chat.completions stand-in returning (or raising) queued replies."""
+
+    def __init__(self, replies=None, delay: float = 0):
+        self.replies = list(replies or [])
+        self.default = "ok"
+        self.delay = delay
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        reply = self.replies.pop(0) if self.replies else self.default
+        if isinstance(reply, BaseException):
+            raise reply
+        if isinstance(reply, str):
+            if kwargs.get("stream"):
+                return FakeStream([reply])
+            return make_completion(reply, kwargs["model"])
+        return reply
+
+
+class FakeEmbeddings:
+    """embeddings stand-in mapping each input text to a fixed vector."""
+
+    def __init__(self, vectors=None):
+        self.vectors = vectors or {}
+        self.calls = []
+
+    async def create(self, model: str, input: str):
+        self.calls.append(input)
+        return SimpleNamespace(data=[SimpleNamespace(embedding=self.vectors[input])])
+
+
+class FakeClient:
+    """AsyncOpenAI stand-in exposing only what the services use."""
+
+    def __init__(self, replies=None, vectors=None):
+        self.chat = SimpleNamespace(completions=FakeCompletions(replies))
+        self.embeddings = FakeEmbeddings(vectors)
+        self.files = SimpleNamespace()
+        self.batches = SimpleNamespace()
+
+    @property
+    def calls(self) -> list:
+        return self.chat.completions.calls
+
+
+@pytest.fixture
+def make_service(monkeypatch):
+    """
+    Build an LLMService whose endpoints use fake clients.
+
+    Call with one (name, client, model) tuple per endpoint, primary first.
+    """
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
+    def factory(*endpoints, semantic: bool = False, concurrency: int = 4):
+        service = LLMService()
+        service.retry_backoff = 0
+        service._retryable = (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+        service.endpoints = [
+            LLMEndpoint(name, client, model, concurrency) for name, client, model in endpoints
+        ]
+        service.client = service.endpoints[0].client
+        service.cache = ResponseCache(service.client, semantic=semantic)
+        return service
+
+    return factory
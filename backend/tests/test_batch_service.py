@@ -0,0 +1,201 @@
+"""
+Tests for BatchService: submission and batch status transitions.
+"""
+
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.services.batch_service import MAX_BATCH_REQUESTS, BatchService
+from app.services.llm_service import LLMService
+
+from tests.conftest import FakeClient
+
+CAREER = {"user_id": 1, "skills": ["python"], "experience_years": 3, "goals": "Become a lead"}
+LEARNING = {"user_id": 2, "current_skills": ["sql"], "target_role": "Data engineer"}
+
+
+class FakeBatchAPI:
+    """files/batches stand-in: records uploads and serves scripted batch states."""
+
+    def __init__(self, client: FakeClient):
+        self.uploads = []
+        self.file_contents = {}
+        self.failing_downloads = 0
+        self.batch = SimpleNamespace(
+            id="batch_1", status="validating", request_counts=None,
+            output_file_id=None, error_file_id=None
+        )
+        client.files.create = self.create_file
+        client.files.content = self.file_content
+        client.batches.create = self.create_batch
+        client.batches.retrieve = self.retrieve_batch
+
+    async def create_file(self, file, purpose):
+        self.uploads.append(file[1].decode())
+        return SimpleNamespace(id="file_in")
+
+    async def create_batch(self, **kwargs):
+        return self.batch
+
+    async def retrieve_batch(self, batch_id):
+        return self.batch
+
+    async def file_content(self, file_id):
+        if self.failing_downloads:
+            self.failing_downloads -= 1
+            raise RuntimeError("download failed")
+        return SimpleNamespace(text=self.file_contents[file_id])
+
+    def finish(self, status="completed", output=None, errors=None):
+        """Move the batch to a final status with the given output/error records."""
+        self.batch.status = status
+        if output is not None:
+            self.batch.output_file_id = "file_out"
+            self.file_contents["file_out"] = "\n".join(json.dumps(r) for r in output)
+        if errors is not None:
+            self.batch.error_file_id = "file_err"
+            self.file_contents["file_err"] = "\n".join(json.dumps(r) for r in errors)
+
+
+def success_record(custom_id, content="advice"):
+    return {
+        "custom_id": custom_id,
+        "response": {"status_code": 200, "body": {
+            "choices": [{"message": {"content": content}}],
+            "usage": {"total_tokens": 42}
+        }},
+        "error": None
+    }
+
+
+def error_record(custom_id, message="server error"):
+    return {
+        "custom_id": custom_id,
+        "response": {"status_code": 500, "body": {"error": {"message": message}}},
+        "error": None
+    }
+
+
+@pytest.fixture
+def batch(make_service):
+    client = FakeClient()
+    api = FakeBatchAPI(client)
+    service = make_service(("openai", client, "gpt-3.5-turbo"))
+    return BatchService(service), api
+
+
+@pytest.mark.asyncio
+async def test_submit_uploads_one_line_per_request(batch):
+    batch_service, api = batch
+
+    job = await batch_service.submit([CAREER, CAREER], [LEARNING])
+
+    assert job == {"batch_id": "batch_1", "status": "validating", "requests": 3}
+    lines = [json.loads(line) for line in api.uploads[0].splitlines()]
+    assert [line["custom_id"] for line in lines] == ["career-0", "career-1", "learning-0"]
+    assert lines[0]["body"]["model"] == "gpt-3.5-turbo"
+
+
+@pytest.mark.asyncio
+async def test_submit_rejects_oversize_prompt(batch):
+    batch_service, api = batch
+    batch_service.llm_service.count_tokens = lambda text: len(text.split())
+    batch_service.llm_service.max_prompt_tokens = 100
+
+    with pytest.raises(ValueError, match="career-1: Prompt too long"):
+        await batch_service.submit([CAREER, {**CAREER, "goals": "word " * 200}], [])
+    assert api.uploads == []
+
+
+@pytest.mark.asyncio
+async def test_submit_rejects_too_many_requests(batch):
+    batch_service, api = batch
+
+    with pytest.raises(ValueError, match="Batch too large"):
+        await batch_service.submit([CAREER] * MAX_BATCH_REQUESTS, [LEARNING])
+    assert api.uploads == []
+
+
+@pytest.mark.asyncio
+async def test_status_without_results_until_finished(batch):
+    batch_service, api = batch
+    await batch_service.submit([CAREER], [])
+    api.batch.status = "in_progress"
+
+    status = await batch_service.get_status("batch_1")
+
+    assert status["status"] == "in_progress"
+    assert status["results"] is None
+    assert await batch_service.get_status("unknown") is None
+
+
+@pytest.mark.asyncio
+async def test_completed_batch_merges_output_and_error_files(batch):
+    batch_service, api = batch
+    await batch_service.submit([CAREER, CAREER], [LEARNING])
+    api.finish(output=[success_record("career-0")], errors=[error_record("learning-0")])
+
+    status = await batch_service.get_status("batch_1")
+    results = {r["custom_id"]: r for r in status["results"]}
+
+    assert status["status"] == "completed"
+    assert results["career-0"]["success"] is True
+    assert results["career-0"]["response"] == "advice"
+    assert results["learning-0"]["success"] is False
+    assert results["learning-0"]["user_id"] == 2
+    assert results["learning-0"]["error"] == "server error"
+    # Missing from both files: still reported, as failed
+    assert results["career-1"]["success"] is False
+
+
+@pytest.mark.asyncio
+async def test_batch_with_only_errors_produces_results(batch):
+    batch_service, api = batch
+    await batch_service.submit([CAREER], [])
+    api.finish(errors=[error_record("career-0", "quota exceeded")])
+
+    status = await batch_service.get_status("batch_1")
+
+    assert [r["error"] for r in status["results"]] == ["quota exceeded"]
+
+
+@pytest.mark.asyncio
+async def test_failed_download_is_retried_on_next_poll(batch):
+    batch_service, api = batch
+    await batch_service.submit([CAREER], [])
+    api.finish(output=[success_record("career-0")])
+    api.failing_downloads = 1
+
+    with pytest.raises(RuntimeError):
+        await batch_service.get_status("batch_1")
+    status = await batch_service.get_status("batch_1")
+
+    assert status["status"] == "completed"
+    assert status["results"][0]["success"] is True
+
+
+@pytest.mark.asyncio
+async def test_status_poll_retries_transient_errors(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    service = LLMService()
+    replies = [
+        httpx.Response(503, headers={"retry-after-ms": "1"}),
+        httpx.Response(200, json={"id": "batch_1", "object": "batch", "status": "in_progress"}),
+    ]
+    # Batch calls bypass the failover pool, so the shared client keeps the SDK retries
+    service.client = service.client.with_options(http_client=httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: replies.pop(0))
+    ))
+    batch_service = BatchService(service)
+    batch_service.jobs["batch_1"] = {"requests": {}, "status": "validating", "results": None}
+
+    status = await batch_service.get_status("batch_1")
+
+    assert status["status"] == "in_progress"
+    assert replies == []
+    assert service.endpoints[0].client.max_retries == 0
+    await service.client.close()
+    await service.aclose()
@@ -0,0 +1,129 @@
+"""
+Tests for the LLM endpoint pool: ordering, failover and fallback handling.
+"""
+
+import asyncio
+
+import openai
+import pytest
+
+from app.services.llm_service import LLMService
+
+from tests.conftest import FakeClient, FakeStream, api_error
+
+
+@pytest.mark.asyncio
+async def test_primary_endpoint_used_when_idle(make_service):
+    primary, fallback = FakeClient(["from primary"]), FakeClient(["from fallback"])
+    service = make_service(("openai", primary, "gpt-3.5-turbo"), ("vllm", fallback, "llama"))
+
+    result = await service.generate_response("hello")
+
+    assert result["response"] == "from primary"
+    assert result["endpoint"] == "openai"
+    assert len(fallback.calls) == 0
+
+
+@pytest.mark.asyncio
+async def test_least_busy_endpoint_first(make_service):
+    primary, fallback = FakeClient(), FakeClient(["from fallback"])
+    service = make_service(("openai", primary, "gpt-3.5-turbo"), ("vllm", fallback, "llama"))
+    service.endpoints[0].in_flight = 3
+
+    result = await service.generate_response("hello")
+
+    assert result["endpoint"] == "vllm"
+    assert fallback.calls[0]["model"] == "llama"
+    assert len(primary.calls) == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_fails_over_and_reports_fallback_model(make_service):
+    primary = FakeClient([api_error(openai.RateLimitError, 429), "from primary"])
+    fallback = FakeClient(["from fallback"])
+    service = make_service(("openai", primary, "gpt-3.5-turbo"), ("vllm", fallback, "llama"))
+
+    result = await service.generate_response("hello")
+
+    assert result["success"] is True
+    assert result["response"] == "from fallback"
+    assert result["model"] == "llama"
+    assert result["endpoint"] == "vllm"
+
+
+@pytest.mark.asyncio
+async def test_fallback_answer_not_cached(make_service):
+    primary = FakeClient([api_error(openai.InternalServerError, 500), "from primary"])
+    fallback = FakeClient(["from fallback"])
+    service = make_service(("openai", primary, "gpt-3.5-turbo"), ("vllm", fallback, "llama"))
+
+    await service.generate_response("hello")
+    result = await service.generate_response("hello")
+
+    assert result["response"] == "from primary"
+    assert "cached" not in result
+    assert len(primary.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_attempts(make_service):
+    primary = FakeClient([api_error(openai.RateLimitError, 429)] * 3)
+    fallback = FakeClient([api_error(openai.RateLimitError, 429)] * 3)
+    service = make_service(("openai", primary, "gpt-3.5-turbo"), ("vllm", fallback, "llama"))
+    service.max_attempts = 3
+
+    result = await service.generate_response("hello")
+
+    assert result["success"] is False
+    # Attempts alternate between endpoints: primary, fallback, primary
+    assert (len(primary.calls), len(fallback.calls)) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_error_does_not_fail_over(make_service):
+    primary = FakeClient([api_error(openai.BadRequestError, 400)])
+    fallback = FakeClient(["from fallback"])
+    service = make_service(("openai", primary, "gpt-3.5-turbo"), ("vllm", fallback, "llama"))
+
+    result = await service.generate_response("hello")
+
+    assert result["success"] is False
+    assert len(fallback.calls) == 0
+
+
+def test_misconfigured_fallback_is_skipped(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setenv("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+    monkeypatch.setenv("VLLM_BASE_URL", "http://localhost:8001/v1")
+    service = LLMService()
+    service.client = openai.AsyncOpenAI(api_key="test")
+
+    def missing_credentials(**kwargs):
+        raise openai.OpenAIError("Missing credentials")
+
+    endpoints = service._build_endpoints(missing_credentials, lambda **kwargs: FakeClient())
+
+    assert [endpoint.name for endpoint in endpoints] == ["openai", "vllm"]
+
+
+@pytest.mark.asyncio
+async def test_streams_hold_slot_until_finished(make_service):
+    gate = asyncio.Event()
+    client = FakeClient([FakeStream(["a", "b"], gate) for _ in range(10)])
+    service = make_service(("openai", client, "gpt-3.5-turbo"), concurrency=2)
+    endpoint = service.endpoints[0]
+
+    async def consume():
+        return "".join([chunk async for chunk in service.generate_response_stream("hello")])
+
+    tasks = [asyncio.create_task(consume()) for _ in range(10)]
+    await asyncio.sleep(0.01)
+
+    # Two streams generating, the other eight waiting for a slot
+    assert len(client.calls) == 2
+    assert endpoint.in_flight == 10
+
+    gate.set()
+    assert await asyncio.gather(*tasks) == ["ab"] * 10
+    assert len(client.calls) == 10
+    assert endpoint.in_flight == 0
@@ -0,0 +1,142 @@
+"""
+Tests for the LLM response cache (exact and semantic tiers).
+"""
+
+import openai
+import pytest
+
+from app.services.llm_service import INTERVIEW_SYSTEM_PROMPT, JSON_RESPONSE_FORMAT, LLMService
+from app.services.response_cache import ResponseCache, make_cache_key
+
+from tests.conftest import FakeClient, api_error, make_completion
+
+
+def test_cache_key_separates_fields():
+    assert make_cache_key("m", "a|b", "c", 0.7) != make_cache_key("m", "a", "b|c", 0.7)
+    assert make_cache_key("m", None, "p", 0.7) != make_cache_key("m", "None", "p", 0.7)
+    assert make_cache_key("m", None, "p", 0.7) != make_cache_key("m", None, "p", 0.7, JSON_RESPONSE_FORMAT)
+    assert make_cache_key("m", None, "p", 0.7) == make_cache_key("m", None, "p", 0.7)
+
+
+@pytest.mark.asyncio
+async def test_exact_hit_skips_api_call(make_service):
+    client = FakeClient(["first answer"])
+    service = make_service(("openai", client, "gpt-3.5-turbo"))
+
+    first = await service.generate_response("hello", "system")
+    second = await service.generate_response("hello", "system")
+
+    assert first["response"] == second["response"] == "first answer"
+    assert "cached" not in first
+    assert second["cached"] is True
+    assert first["tokens"]["total"] == 15
+    assert second["tokens"] == {"prompt": 0, "completion": 0, "total": 0}
+    assert len(client.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_different_request_misses(make_service):
+    client = FakeClient(["a", "b", "c"])
+    service = make_service(("openai", client, "gpt-3.5-turbo"))
+
+    await service.generate_response("hello", "system")
+    await service.generate_response("hello", "other system")
+    await service.generate_response("hello", "system", JSON_RESPONSE_FORMAT)
+
+    assert len(client.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_response_not_cached(make_service):
+    client = FakeClient([api_error(openai.BadRequestError, 400), "recovered"])
+    service = make_service(("openai", client, "gpt-3.5-turbo"))
+
+    failed = await service.generate_response("hello")
+    result = await service.generate_response("hello")
+
+    assert failed["success"] is False
+    assert result["response"] == "recovered"
+    assert len(client.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_invalid_interview_json_not_cached(make_service):
+    truncated = make_completion('{"questions": ["a", ', finish_reason="length")
+    client = FakeClient([truncated, '{"questions": ["a", "b"]}'])
+    service = make_service(("openai", client, "gpt-3.5-turbo"))
+
+    failed = await service.generate_interview_questions("engineer", "junior")
+    result = await service.generate_interview_questions("engineer", "junior")
+    cached = await service.generate_interview_questions("engineer", "junior")
+
+    assert failed["success"] is False
+    assert "length" in failed["error"]
+    assert result["parsed"].questions == ["a", "b"]
+    assert cached["cached"] is True
+    assert len(client.calls) == 2
+    assert client.calls[0]["messages"][0]["content"] == INTERVIEW_SYSTEM_PROMPT
+
+
+@pytest.mark.asyncio
+async def test_templated_prompts_skip_semantic_tier(make_service):
+    pytest.importorskip("faiss")
+    client = FakeClient(["analysis"])
+    service = make_service(("openai", client, "gpt-3.5-turbo"), semantic=True)
+
+    await service.analyze_career_profile(["python"], 3, "Become a lead")
+
+    assert client.embeddings.calls == []
+
+
+@pytest.mark.asyncio
+async def test_semantic_hit_for_similar_prompt(make_service):
+    pytest.importorskip("faiss")
+    client = FakeClient(
+        ["paris"],
+        vectors={
+            "capital of France?": [1.0, 0.0, 0.0, 0.0],
+            "France's capital?": [0.99, 0.01, 0.0, 0.0],
+            "capital of Peru?": [0.0, 1.0, 0.0, 0.0],
+        }
+    )
+    service = make_service(("openai", client, "gpt-3.5-turbo"), semantic=True)
+
+    await service.generate_response("capital of France?", semantic=True)
+    similar = await service.generate_response("France's capital?", semantic=True)
+    different = await service.generate_response("capital of Peru?", semantic=True)
+
+    assert similar["cached"] is True
+    assert similar["response"] == "paris"
+    assert similar["tokens"]["total"] == 0
+    assert "cached" not in different
+    assert len(client.calls) == 2
+
+
+def test_semantic_entries_capped_across_namespaces(monkeypatch):
+    pytest.importorskip("faiss")
+    np = pytest.importorskip("numpy")
+    monkeypatch.setenv("LLM_CACHE_MAX_ENTRIES", "3")
+    cache = ResponseCache(FakeClient(), semantic=True)
+
+    def vector(i):
+        v = np.zeros((1, 8), dtype="float32")
+        v[0, i] = 1.0
+        return v
+
+    for i in range(5):
+        cache.add(f"namespace-{i}", vector(i), {"response": i})
+
+    # The two oldest namespaces were evicted and their empty indexes dropped
+    assert sorted(cache.indexes) == ["namespace-2", "namespace-3", "namespace-4"]
+    assert cache.search("namespace-4", vector(4)) == {"response": 4}
+    assert cache.search("namespace-0", vector(0)) is None
+
+
+@pytest.mark.asyncio
+async def test_zero_max_entries_disables_cache(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setenv("LLM_CACHE_MAX_ENTRIES", "0")
+    service = LLMService()
+
+    assert service.cache is None
+    await service.aclose()
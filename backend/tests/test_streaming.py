@@ -0,0 +1,84 @@
+"""
+Tests for streaming responses: SSE framing, cache hits and stream cleanup.
+"""
+
+import orjson
+import pytest
+
+from app.routes.ai import _sse_events
+
+from tests.conftest import FakeClient, FakeStream
+
+
+async def chunks(*items):
+    """Async iterator over text chunks (exceptions among them are raised)."""
+    for item in items:
+        if isinstance(item, BaseException):
+            raise item
+        yield item
+
+
+async def collect(events) -> list:
+    return [event async for event in events]
+
+
+@pytest.mark.asyncio
+async def test_sse_frames_tokens_and_ends_with_done():
+    events = await collect(_sse_events(chunks("Hel", "lo")))
+
+    assert events == [
+        b"data: " + orjson.dumps({"token": "Hel"}) + b"\n\n",
+        b"data: " + orjson.dumps({"token": "lo"}) + b"\n\n",
+        b"data: [DONE]\n\n",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sse_mid_stream_error_becomes_error_event():
+    events = await collect(_sse_events(chunks("Hel", RuntimeError("connection lost"))))
+
+    assert events == [
+        b"data: " + orjson.dumps({"token": "Hel"}) + b"\n\n",
+        b"data: " + orjson.dumps({"error": "connection lost"}) + b"\n\n",
+        b"data: [DONE]\n\n",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_exact_cache_hit_streamed_as_one_chunk(make_service):
+    client = FakeClient(["full answer"])
+    service = make_service(("openai", client, "gpt-3.5-turbo"))
+    await service.generate_response("hello", "system")
+
+    streamed = await collect(service.generate_response_stream("hello", "system"))
+
+    assert streamed == ["full answer"]
+    assert len(client.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_closed_on_early_exit(make_service):
+    stream = FakeStream(["a", "b", "c"])
+    service = make_service(("openai", FakeClient([stream]), "gpt-3.5-turbo"))
+
+    chunks_iter = service.generate_response_stream("hello")
+    assert await chunks_iter.__anext__() == "a"
+    # e.g. the client disconnected
+    await chunks_iter.aclose()
+
+    assert stream.closed is True
+    assert service.endpoints[0].in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_closed_on_error(make_service):
+    stream = FakeStream(["a", RuntimeError("connection lost")])
+    service = make_service(("openai", FakeClient([stream]), "gpt-3.5-turbo"))
+
+    events = await collect(_sse_events(service.generate_response_stream("hello")))
+
+    assert events[-2:] == [
+        b"data: " + orjson.dumps({"error": "connection lost"}) + b"\n\n",
+        b"data: [DONE]\n\n",
+    ]
+    assert stream.closed is True
@@ -0,0 +1,49 @@
+"""
+Tests for UserService: keeping the email index in sync with the users.
+"""
+
+import pytest
+
+from app.models.user import UserCreate, UserUpdate
+from app.services.user_service import UserService
+
+
+def new_user(email: str) -> UserCreate:
+    return UserCreate(email=email, full_name="Test User", password="Secret123!")
+
+
+def test_create_rejects_registered_email():
+    service = UserService()
+    first = service.create_user(new_user("a@x.com"))
+
+    with pytest.raises(ValueError, match="Email already registered"):
+        service.create_user(new_user("a@x.com"))
+
+    assert service.get_user_by_email("a@x.com")["id"] == first.id
+    assert len(service.users_db) == 1
+
+
+def test_update_moves_email_index():
+    service = UserService()
+    user = service.create_user(new_user("a@x.com"))
+    other = service.create_user(new_user("b@x.com"))
+
+    service.update_user(user.id, UserUpdate(email="c@x.com"))
+
+    assert service.get_user_by_email("a@x.com") is None
+    assert service.get_user_by_email("c@x.com")["id"] == user.id
+    with pytest.raises(ValueError, match="Email already registered"):
+        service.update_user(other.id, UserUpdate(email="c@x.com"))
+    assert service.get_user(other.id).email == "b@x.com"
+
+
+def test_delete_frees_email_for_reuse():
+    service = UserService()
+    user = service.create_user(new_user("a@x.com"))
+
+    assert service.delete_user(user.id) is True
+    assert service.get_user_by_email("a@x.com") is None
+
+    again = service.create_user(new_user("a@x.com"))
+    assert again.id != user.id
+    assert service.get_user_by_email("a@x.com")["id"] == again.id